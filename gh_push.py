@@ -10,41 +10,164 @@ Features:
 - Handles existing GitHub Pages
 - Validates presence of web files
 - Error detection and suggestions
+- Optional resident daemon (--daemon) that later invocations forward to
 """
 
 import os
+import atexit
+import contextlib
+import asyncio
+import functools
 import sys
 import subprocess
+import queue
+import secrets
+import shlex
+import threading
+import traceback
 import re
 import platform
 import shutil
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple, Optional, List, Dict, Union
 from enum import Enum
 import json
-import urllib.request
-import urllib.error
-import socket
+import html
+import http.client
 import time
-import glob
 
-try:
-    from rich.console import Console
-    from rich.prompt import Confirm, Prompt
-    from rich.panel import Panel
-    from rich.syntax import Syntax
-    from rich import print as rprint
-except ImportError:
-    print("The 'rich' library is required. Installing...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "rich"], check=False)
-    from rich.console import Console
-    from rich.prompt import Confirm, Prompt
-    from rich.panel import Panel
-    from rich.syntax import Syntax
-    from rich import print as rprint
+# rich is imported lazily (see _get_console/_get_prompt) so that code paths
+# which never print or prompt don't pay for importing it
+_console = None
+
+# How output is rendered and questions are answered; see configure_ui
+_ui = {"rich": True, "interactive": True, "assume_yes": False}
+
+# Rich status messages held back by batched_status, or None when printing directly
+_status_buffer: Optional[List] = None
+
+# How changes are pushed; see run_publish
+_push_options = {"use_pygit2": False}
+
+# The platform cannot change while the script runs, so resolve it once
+PLATFORM_NAME = platform.system()
+_SYSTEM = PLATFORM_NAME.lower()
+IS_WINDOWS = _SYSTEM == "windows"
+IS_MACOS = _SYSTEM == "darwin"
+IS_LINUX = _SYSTEM == "linux"
+
+# Default macOS and Windows filesystems ignore case in file names
+CASE_INSENSITIVE_FS = IS_WINDOWS or IS_MACOS
+
+# Absolute paths of the tools we run most, resolved once
+GH_PATH = shutil.which("gh") or "gh"
+GIT_PATH = shutil.which("git") or "git"
+_RESOLVED_EXECUTABLES = {"gh": GH_PATH, "git": GIT_PATH}
+
+# URL prefixes of GitHub remotes as printed by `git remote -v`
+GITHUB_HTTPS_PREFIX = "https://github.com/"
+GITHUB_SSH_PREFIX = "git@github.com:"
+
+# git push errors for a branch that doesn't exist on one side or the other
+_NO_REMOTE_REF = re.compile(r"remote ref does not exist|src refspec \S+ does not match any")
+
+# How a failed git push is classified, checked in order against each stderr line
+_PUSH_ERRORS = (
+    ("auth", re.compile(r"could not read Username|Authentication failed|Permission denied")),
+    ("rejected", re.compile(r"\[rejected\]|non-fast-forward")),
+    ("no_ref", _NO_REMOTE_REF),
+)
+
+# Branch names tried when pushing the current branch fails for lack of a ref
+DEFAULT_BRANCHES = ("main", "master")
+
+# Objects a push has to upload before --use-pygit2 hands it to libgit2, whose
+# pack builder can compress on every core; smaller pushes stay with git
+PYGIT2_MIN_OBJECTS = 500
+
+# Symbolic ref prefix of a checked-out branch, as dulwich reads HEAD
+DULWICH_BRANCH_PREFIX = b"ref: refs/heads/"
+
+# Fallback patterns for GitHub remote URLs the prefix checks don't cover
+_REMOTE_RE = re.compile(
+    r'^(?:https://(?:[^@/\s]+@)?github\.com/|(?:ssh://)?git@github\.com[:/])'
+    r'([^/\s]+)/([^/\s]+?)(?:\.git)?/?$'
+)
+
+# What the git-based fallback publishes when there is no build directory:
+# these top-level files, top-level files with these extensions, and
+# everything inside these top-level directories
+WEB_ROOT_FILES = {"index.html", "404.html"}
+WEB_ROOT_EXTENSIONS = {".css", ".js"}
+WEB_ASSET_DIRS = {"assets", "images", "img", "css", "js", "fonts", "media"}
+
+# Build output directories checked, in order, for JavaScript projects
+BUILD_DIRS = ("build", "dist", "out", "public", ".next")
+
+# Threads used to copy files into the deploy directory
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Page wrapped around the README when the fallback has to generate an index.html;
+# the README itself is streamed in between
+README_INDEX_HEADER = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitHub Pages</title>
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }
+        h1, h2, h3 { color: #0366d6; }
+        pre { background-color: #f6f8fa; padding: 16px; border-radius: 6px; overflow: auto; }
+        code { font-family: SFMono-Regular, Consolas, "Liberation Mono", Menlo, monospace; }
+    </style>
+</head>
+<body>
+    <div id="content">
+        <!-- README content will be displayed here -->
+        <h1>GitHub Pages</h1>
+        <p>This page was automatically generated from README.md</p>
+        <pre>"""
+README_INDEX_FOOTER = """</pre>
+    </div>
+</body>
+</html>"""
+README_CHUNK_SIZE = 64 * 1024
+
+# On-disk cache of the GitHub CLI version check, under the user cache directory
+CACHE_DIR_NAME = "notashare"
+VERSION_CACHE_FILE = "gh_version.json"
+VERSION_CACHE_TTL = 24 * 60 * 60
+SKIP_VERSION_CHECK_ENV = "NOTASHARE_SKIP_VERSION_CHECK"
+
+# First GitHub CLI release shipping each subcommand we depend on
+GH_FEATURE_MIN_VERSIONS = {
+    "api": (1, 4, 0)
+}
+_GH_VERSION_RE = re.compile(r"gh version (\d+)\.(\d+)\.(\d+)")
+
+# Where the latest GitHub CLI release is looked up, and how its tag reads
+GH_LATEST_RELEASE_PATH = "/repos/cli/cli/releases/latest"
+_RELEASE_TAG_RE = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)")
+
+# Host serving the GitHub REST API
+GITHUB_API_HOST = "api.github.com"
+
+# Parallel publishes for --repos unless --jobs says otherwise: three quarters
+# of the CPUs, leaving headroom for the git and gh processes each one starts
+DEFAULT_JOBS = max(1, (os.cpu_count() or 1) * 3 // 4)
 
-console = Console()
+# Base name of the daemon's socket (POSIX) or named pipe (Windows)
+DAEMON_NAME = "gh_push"
+
+# Separator printed between the outputs of batched git probes
+PROBE_SENTINEL = "__gh_push_probe_end__"
+
+# Longest path list from `git status` passed to `git add`, in characters;
+# beyond this `git add .` is used. Windows caps a whole command line at
+# 32767 characters, so this leaves room for the executable and flags
+GIT_ADD_MAX_CHARS = 24000
 
 
 class Status(Enum):
@@ -54,6 +177,101 @@ class Status(Enum):
     INFO = "info"
 
 
+def _import_rich() -> None:
+    """Make sure the 'rich' library is available, installing it if needed."""
+    try:
+        import rich  # noqa: F401
+    except ImportError:
+        print("The 'rich' library is required. Installing...")
+        subprocess.run([sys.executable, "-m", "pip", "install", "rich"], check=False)
+
+
+def _get_console():
+    """Get the shared rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        _import_rich()
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+class InputRequiredError(Exception):
+    """Raised when a question without a default is asked in non-interactive mode."""
+
+
+class _Confirm:
+    """Yes/no question honoring --yes, --non-interactive and --no-rich."""
+    
+    @staticmethod
+    def ask(prompt: str, default: Optional[bool] = None, **kwargs) -> bool:
+        if _ui["assume_yes"]:
+            return True
+        if not _ui["interactive"]:
+            return bool(default)
+        
+        flush_status()
+        if _ui["rich"]:
+            _import_rich()
+            from rich.prompt import Confirm
+            if default is not None:
+                kwargs["default"] = default
+            return Confirm.ask(prompt, console=_get_console(), **kwargs)
+        
+        while True:
+            answer = input(f"{prompt} [y/n]: ").strip().lower()
+            if not answer and default is not None:
+                return default
+            if answer in ("y", "yes"):
+                return True
+            if answer in ("n", "no"):
+                return False
+
+
+class _Prompt:
+    """Free-form question honoring --non-interactive and --no-rich."""
+    
+    @staticmethod
+    def ask(prompt: str, choices: Optional[List[str]] = None, default: Optional[str] = None, **kwargs) -> str:
+        if not _ui["interactive"]:
+            if default is None:
+                raise InputRequiredError(prompt)
+            return default
+        
+        flush_status()
+        if _ui["rich"]:
+            _import_rich()
+            from rich.prompt import Prompt
+            if default is not None:
+                kwargs["default"] = default
+            return Prompt.ask(prompt, choices=choices, console=_get_console(), **kwargs)
+        
+        suffix = f" [{'/'.join(choices)}]" if choices else ""
+        if default:
+            suffix += f" ({default})"
+        while True:
+            answer = input(f"{prompt}{suffix}: ").strip()
+            if not answer and default is not None:
+                return default
+            if not choices or answer in choices:
+                return answer
+            print(f"Please select one of: {', '.join(choices)}")
+
+
+def _get_prompt():
+    """Get the Confirm and Prompt helpers for the current UI mode."""
+    return _Confirm, _Prompt
+
+
+def configure_ui(args) -> Dict[str, bool]:
+    """Apply the UI flags from parsed arguments and return the previous settings."""
+    previous = dict(_ui)
+    _ui["rich"] = not args.no_rich
+    _ui["interactive"] = not args.non_interactive
+    _ui["assume_yes"] = args.yes
+    return previous
+
+
 def print_status(message: str, status: Status, details: str = None) -> None:
     """Print a formatted status message with optional details."""
     color_map = {
@@ -62,51 +280,219 @@ def print_status(message: str, status: Status, details: str = None) -> None:
         Status.ERROR: "red",
         Status.INFO: "blue"
     }
+    if not _ui["rich"]:
+        print(f"{status.value.upper()}: {message}")
+        if details:
+            print("\n".join(f"    {line}" for line in details.splitlines()))
+        return
+    
     status_text = f"[{color_map[status]}]{status.value.upper()}[/{color_map[status]}]"
     
-    console.print(f"{status_text}: {message}")
+    line = f"{status_text}: {message}"
+    # Creating the console installs rich if needed, so it comes before any rich import
+    console = _get_console()
     if details:
-        console.print(Panel(details, expand=False))
+        # Render the status line and its details panel in a single write
+        from rich.console import Group
+        from rich.panel import Panel
+        line = Group(line, Panel(details, expand=False))
+    
+    if _status_buffer is not None:
+        _status_buffer.append(line)
+    else:
+        console.print(line)
+
+
+def flush_status() -> None:
+    """Print the status messages held back by batched_status in one console write."""
+    global _status_buffer
+    if _status_buffer:
+        console = _get_console()
+        from rich.console import Group
+        console.print(Group(*_status_buffer))
+        _status_buffer = []
+
+
+@contextlib.contextmanager
+def batched_status():
+    """
+    Hold back rich status messages until the block ends, then render them together.
+    Questions flush the messages first, so output never falls behind a prompt.
+    """
+    global _status_buffer
+    if _status_buffer is not None:
+        # Already batching; the outer block flushes
+        yield
+        return
+    
+    _status_buffer = []
+    try:
+        yield
+    finally:
+        flush_status()
+        _status_buffer = None
 
 
-def is_windows() -> bool:
-    """Check if the current platform is Windows."""
-    return platform.system().lower() == "windows"
+def _resolve_command(cmd: List[str]) -> List[str]:
+    """Substitute the absolute path of gh/git so no intermediate shell is needed."""
+    executable = _RESOLVED_EXECUTABLES.get(cmd[0])
+    if executable:
+        return [executable] + cmd[1:]
+    return cmd
 
 
-def is_macos() -> bool:
-    """Check if the current platform is macOS."""
-    return platform.system().lower() == "darwin"
+class ShellSession:
+    """
+    A long-running POSIX shell that commands are piped into.
+    Each command costs a fork inside the shell instead of a full subprocess
+    launch from Python; a random end marker tells us where its output stops.
+    """
+    
+    def __init__(self, shell: str):
+        self._marker = f"__gh_push_done_{secrets.token_hex(8)}__"
+        self._lock = threading.Lock()
+        self._proc = subprocess.Popen(
+            [shell, "-s"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            # Output that isn't valid UTF-8 must not kill the reader threads
+            errors="replace"
+        )
+        # Drain both pipes on threads so neither can fill up and stall the shell
+        self._stdout = self._start_reader(self._proc.stdout)
+        self._stderr = self._start_reader(self._proc.stderr)
+    
+    @staticmethod
+    def _start_reader(stream) -> "queue.Queue":
+        lines = queue.Queue()
+        
+        def pump():
+            # The end-of-output marker must be queued even if reading fails,
+            # or _read_until would wait forever
+            try:
+                for line in stream:
+                    lines.put(line)
+            finally:
+                lines.put(None)
+        
+        threading.Thread(target=pump, daemon=True).start()
+        return lines
+    
+    def _read_until(self, lines: "queue.Queue", prefix: str) -> Tuple[str, str]:
+        """Collect output up to the marker line and return it with the marker line."""
+        collected = []
+        while True:
+            line = lines.get()
+            if line is None:
+                # Leave the marker for later reads, which must fail the same way
+                lines.put(None)
+                raise OSError("shell session exited unexpectedly")
+            if line.startswith(prefix):
+                # Drop the newline printed in front of the marker
+                return "".join(collected)[:-1], line.strip()
+            collected.append(line)
+    
+    def run(self, script: str) -> Tuple[int, str, str]:
+        """Run a shell snippet in the current directory and return exit code, stdout, and stderr."""
+        with self._lock:
+            if self._proc.poll() is not None:
+                raise OSError("shell session is not running")
+            
+            # stdin is detached so commands can't swallow the rest of our script
+            self._proc.stdin.write(
+                f"cd {shlex.quote(os.getcwd())} && {{ {script}\n}} </dev/null\n"
+                f"printf '\\n{self._marker}:%d\\n' $?\n"
+                f"printf '\\n{self._marker}\\n' >&2\n"
+            )
+            self._proc.stdin.flush()
+            
+            stdout, marker_line = self._read_until(self._stdout, self._marker)
+            stderr, _ = self._read_until(self._stderr, self._marker)
+            return int(marker_line.rpartition(":")[2]), stdout, stderr
+    
+    def close(self) -> None:
+        """Ask the shell to exit."""
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
 
 
-def is_linux() -> bool:
-    """Check if the current platform is Linux."""
-    return platform.system().lower() == "linux"
+_shell_session: Optional[ShellSession] = None
+# Threads such as the background Pages lookup may start the session too
+_shell_session_lock = threading.Lock()
 
 
-def get_executable_extension() -> str:
-    """Get the extension for executable files on the current platform."""
-    return ".exe" if is_windows() else ""
+def get_shell_session() -> Optional[ShellSession]:
+    """
+    Get the shared shell session, starting it on first use.
+    Returns None on Windows, where cmd.exe cannot safely re-parse arbitrary
+    argv, and wherever no POSIX shell is available.
+    """
+    global _shell_session
+    with _shell_session_lock:
+        if _shell_session is None and not IS_WINDOWS:
+            shell = shutil.which("sh")
+            if shell:
+                try:
+                    _shell_session = ShellSession(shell)
+                except OSError:
+                    return None
+                atexit.register(_shell_session.close)
+        return _shell_session
+
+
+def reset_shell_session() -> None:
+    """Stop the shared shell session; the next command starts one with the current environment."""
+    global _shell_session
+    with _shell_session_lock:
+        if _shell_session is not None:
+            atexit.unregister(_shell_session.close)
+            _shell_session.close()
+            _shell_session = None
+
+
+def run_shell(script: str) -> Tuple[int, str, str]:
+    """Run a shell script and return exit code and unstripped stdout and stderr."""
+    session = get_shell_session()
+    if session is not None:
+        try:
+            return session.run(script)
+        except OSError:
+            pass
+    
+    cmd = ["cmd.exe", "/c", script] if IS_WINDOWS else ["sh", "-c", script]
+    try:
+        proc = subprocess.run(cmd, check=False, text=True, capture_output=True)
+        return proc.returncode, proc.stdout, proc.stderr
+    except Exception as e:
+        return 1, "", str(e)
 
 
 def run_command(cmd: List[str], check: bool = True) -> Tuple[int, str, str]:
     """Run a command and return exit code, stdout, and stderr."""
+    cmd = _resolve_command(cmd)
+    
+    # gh/git calls go through the shared shell session when there is one
+    if cmd[0] in (GH_PATH, GIT_PATH):
+        session = get_shell_session()
+        if session is not None:
+            try:
+                return_code, stdout, stderr = session.run(shlex.join(cmd))
+                return return_code, stdout.strip(), stderr.strip()
+            except OSError:
+                pass
+    
     try:
-        # For Windows, we need to set shell=True for some commands
-        use_shell = is_windows() and cmd[0] in ["gh", "git"]
-        
-        # Add .exe extension for Windows if needed
-        if is_windows() and cmd[0] in ["gh", "git"]:
-            # Check if the command already has .exe
-            if not cmd[0].endswith(".exe"):
-                cmd[0] = f"{cmd[0]}{get_executable_extension()}"
-        
         proc = subprocess.run(
             cmd, 
             check=False, 
             text=True, 
             capture_output=True,
-            shell=use_shell if use_shell else False
+            shell=False
         )
         return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
     except FileNotFoundError:
@@ -115,9 +501,138 @@ def run_command(cmd: List[str], check: bool = True) -> Tuple[int, str, str]:
         return 1, "", str(e)
 
 
+def run_quiet(cmd: List[str]) -> int:
+    """
+    Run a command whose output we don't need and return its exit code.
+    The output goes straight to the null device, so there are no pipes to
+    create and drain.
+    """
+    cmd = _resolve_command(cmd)
+    
+    if cmd[0] in (GH_PATH, GIT_PATH):
+        session = get_shell_session()
+        if session is not None:
+            try:
+                return session.run(f"{shlex.join(cmd)} >/dev/null 2>&1")[0]
+            except OSError:
+                pass
+    
+    try:
+        if not hasattr(os, "posix_spawnp"):
+            return subprocess.call(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_RDWR, 0) for fd in (0, 1, 2)
+        ]
+        pid = os.posix_spawnp(cmd[0], cmd, os.environ, file_actions=file_actions)
+        _, status = os.waitpid(pid, 0)
+        return os.WEXITSTATUS(status) if os.WIFEXITED(status) else 1
+    except OSError:
+        return 1
+
+
+def _run_each(commands: List[List[str]], optional: Tuple[int, ...]) -> Tuple[int, str, str]:
+    """Run commands one at a time, stopping at the first failure not listed in optional."""
+    result = (0, "", "")
+    for index, cmd in enumerate(commands):
+        result = run_command(cmd, check=False)
+        if result[0] != 0 and index not in optional:
+            break
+    return result
+
+
+def _split_steps(output: str, marker: str) -> Dict[int, str]:
+    """Split batched output at the per-step marker lines, keyed by step index."""
+    sections: Dict[int, str] = {}
+    # Output that doesn't end in a newline leaves the next marker mid-line
+    parts = re.split(rf"{re.escape(marker)}(\d+)\n", output)
+    for index, text in zip(parts[1::2], parts[2::2]):
+        sections[int(index)] = text
+    if len(parts) > 1 and parts[0]:
+        sections[int(parts[1])] = parts[0] + sections[int(parts[1])]
+    return sections
+
+
+def run_git_batch(commands: List[List[str]], optional: Tuple[int, ...] = ()) -> Tuple[int, str, str]:
+    """
+    Run several commands as a single `&&` chain, saving a launch per command.
+    Failures of the commands whose indexes are in optional are ignored. Each
+    step marks where its output starts and reports its own failure, so the
+    returned result belongs to the step that actually failed without running
+    anything twice.
+    """
+    if IS_WINDOWS:
+        # cmd.exe cannot safely re-parse arbitrary argv (see get_shell_session)
+        return _run_each(commands, optional)
+    
+    marker = f"__gh_push_step_{secrets.token_hex(4)}:"
+    steps = []
+    for index, cmd in enumerate(commands):
+        step = shlex.join(_resolve_command(cmd))
+        if index in optional:
+            step = f"{{ {step} || true; }}"
+        else:
+            # `false` stops the chain without exiting the shared shell session
+            step = f"{{ {step} || {{ echo {marker}failed:$? >&2; false; }}; }}"
+        steps.append(f"echo {marker}{index} && echo {marker}{index} >&2 && {step}")
+    
+    return_code, stdout, stderr = run_shell(" && ".join(steps))
+    
+    failed = re.search(rf"{re.escape(marker)}failed:(\d+)\n?", stderr)
+    if failed:
+        stderr = stderr[:failed.start()] + stderr[failed.end():]
+    out_sections = _split_steps(stdout, marker)
+    err_sections = _split_steps(stderr, marker)
+    
+    if return_code != 0 and failed and err_sections:
+        # The last step that started is the one that failed
+        index = max(err_sections)
+        return (
+            int(failed.group(1)),
+            out_sections.get(index, "").strip(),
+            err_sections[index].strip()
+        )
+    if return_code != 0:
+        # The chain broke before any step could report, e.g. the shell failed
+        return return_code, stdout.strip(), stderr.strip()
+    return (
+        return_code,
+        "".join(out_sections.values()).strip(),
+        "".join(err_sections.values()).strip()
+    )
+
+
+async def arun_command(cmd: List[str]) -> Tuple[int, str, str]:
+    """Asynchronous counterpart of run_command, for probes that run concurrently."""
+    cmd = _resolve_command(cmd)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+    except FileNotFoundError:
+        return 1, "", f"Command not found: {cmd[0]}"
+    except Exception as e:
+        return 1, "", str(e)
+    
+    return (
+        proc.returncode,
+        stdout.decode(errors="replace").strip(),
+        stderr.decode(errors="replace").strip()
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def which(program: str) -> Optional[str]:
     """Cross-platform 'which' implementation."""
-    if is_windows():
+    if IS_WINDOWS:
         # Look for common extensions on Windows
         extensions = [".exe", ".bat", ".cmd", ".ps1"]
         
@@ -134,24 +649,26 @@ def which(program: str) -> Optional[str]:
     return shutil.which(program)
 
 
+@functools.lru_cache(maxsize=None)
 def is_gh_installed() -> bool:
     """Check if GitHub CLI is installed."""
     return which("gh") is not None
 
 
+@functools.lru_cache(maxsize=None)
 def get_gh_installation_instructions() -> str:
     """Get platform-specific instructions for installing GitHub CLI."""
-    if is_windows():
+    if IS_WINDOWS:
         return (
             "Install with winget: winget install GitHub.cli\n"
             "Or download from: https://cli.github.com/"
         )
-    elif is_macos():
+    elif IS_MACOS:
         return (
             "Install with Homebrew: brew install gh\n"
             "Or download from: https://cli.github.com/"
         )
-    elif is_linux():
+    elif IS_LINUX:
         return (
             "For Debian/Ubuntu: apt install gh\n"
             "For Fedora: dnf install gh\n"
@@ -161,31 +678,34 @@ def get_gh_installation_instructions() -> str:
         return "Download from: https://cli.github.com/"
 
 
-def is_gh_authenticated() -> bool:
-    """Check if GitHub CLI is authenticated."""
-    return_code, _, stderr = run_command(["gh", "auth", "status"], check=False)
+async def is_gh_authenticated_async() -> bool:
+    """Check if GitHub CLI is authenticated, without blocking the event loop."""
+    return_code, _, stderr = await arun_command(["gh", "auth", "status"])
     
     # Handle unknown command error
     if return_code != 0 and "unknown command" in stderr and "auth" in stderr:
-        # Fallback: try to check if git is configured with GitHub credentials
-        ret_code, stdout, _ = run_command(["git", "config", "--get", "github.token"], check=False)
-        if ret_code == 0 and stdout.strip():
-            return True
-            
-        # Also check if user has git credentials configured, which might indicate they're authenticated
-        ret_code, stdout, _ = run_command(["git", "config", "--get", "user.name"], check=False)
-        has_name = ret_code == 0 and stdout.strip()
-        
-        ret_code, stdout, _ = run_command(["git", "config", "--get", "user.email"], check=False)
-        has_email = ret_code == 0 and stdout.strip()
-        
-        # If they have both name and email configured, assume they might be authenticated
-        # This is not a perfect check but better than nothing
-        return has_name and has_email
-        
+        # The fallback reads git config, which blocks, so it gets a worker thread
+        return await asyncio.get_running_loop().run_in_executor(None, _has_git_credentials)
+    
     return return_code == 0
 
 
+def _has_git_credentials() -> bool:
+    """Guess from git config whether an old gh without 'auth' can reach GitHub."""
+    # Fallback: try to check if git is configured with GitHub credentials
+    git_config = read_git_config()
+    if git_config.get("github.token", "").strip():
+        return True
+        
+    # Also check if user has git credentials configured, which might indicate they're authenticated
+    has_name = bool(git_config.get("user.name", "").strip())
+    has_email = bool(git_config.get("user.email", "").strip())
+    
+    # If they have both name and email configured, assume they might be authenticated
+    # This is not a perfect check but better than nothing
+    return has_name and has_email
+
+
 def authenticate_gh() -> bool:
     """Guide the user through GitHub CLI authentication."""
     print_status(
@@ -193,6 +713,8 @@ def authenticate_gh() -> bool:
         Status.INFO,
         "You'll be guided through the authentication process."
     )
+    # The login can take a while, so show the messages so far first
+    flush_status()
     
     return_code, _, stderr = run_command(["gh", "auth", "login"], check=False)
     
@@ -212,9 +734,37 @@ def authenticate_gh() -> bool:
             print_status("Authentication failed", Status.ERROR, stderr)
         return False
     
+    reset_github_client()
     return True
 
 
+@functools.lru_cache(maxsize=None)
+def _load_dulwich():
+    """Return dulwich's Repo class, or None when dulwich is not installed."""
+    try:
+        from dulwich.repo import Repo
+    except ImportError:
+        return None
+    return Repo
+
+
+def open_dulwich_repo():
+    """
+    Open the repository in the current directory with dulwich, if available.
+    Read-only queries use it to read .git directly instead of spawning git;
+    returns None when dulwich is missing or this is not a repository root.
+    """
+    repo_class = _load_dulwich()
+    if repo_class is None or not check_git_repo():
+        return None
+    
+    try:
+        return repo_class(".")
+    except Exception:
+        # Anything dulwich can't read is left to git itself
+        return None
+
+
 def check_git_repo() -> bool:
     """Check if current directory is a git repository."""
     return os.path.isdir(".git")
@@ -222,12 +772,26 @@ def check_git_repo() -> bool:
 
 def initialize_git_repo() -> bool:
     """Initialize a git repository."""
-    return_code, _, _ = run_command(["git", "init"])
+    return_code = run_quiet(["git", "init"])
+    # Anything probed before belonged to an enclosing repository, if any
+    reset_repository_caches()
     return return_code == 0
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_branch() -> str:
-    """Get the name of the current git branch."""
+    """
+    Get the name of the current git branch.
+    Memoized for the run; reset_repository_caches forgets it.
+    """
+    repo = open_dulwich_repo()
+    if repo is not None:
+        head = repo.refs.read_ref(b"HEAD") or b""
+        if head.startswith(DULWICH_BRANCH_PREFIX):
+            return head[len(DULWICH_BRANCH_PREFIX):].decode("utf-8")
+        # Detached HEAD
+        return "main"
+    
     return_code, stdout, _ = run_command(["git", "branch", "--show-current"], check=False)
     
     if return_code == 0 and stdout:
@@ -242,31 +806,178 @@ def get_current_branch() -> str:
     return "main"
 
 
-def get_remote_info() -> Dict:
-    """Get information about the remote repository."""
+_git_config_cache: Optional[Dict[str, str]] = None
+
+
+def parse_git_config(output: str, null_terminated: bool = False) -> Dict[str, str]:
+    """
+    Parse `git config --list` output into a dict; later entries win.
+    With null_terminated, expects `--list -z` output (key, newline, value, NUL).
+    """
+    entry_sep, key_sep = ("\0", "\n") if null_terminated else ("\n", "=")
+    config = {}
+    for entry in output.split(entry_sep):
+        key, sep, value = entry.partition(key_sep)
+        key = key.strip()
+        if key:
+            config[key] = value if null_terminated else value.strip()
+    return config
+
+
+def read_git_config() -> Dict[str, str]:
+    """Read the effective git configuration with a single cached `git config --list` call."""
+    global _git_config_cache
+    if _git_config_cache is None:
+        return_code, stdout, _ = run_command(["git", "config", "--list", "-z"], check=False)
+        _git_config_cache = parse_git_config(stdout, null_terminated=True) if return_code == 0 else {}
+    return dict(_git_config_cache)
+
+
+def invalidate_git_config() -> None:
+    """Forget the cached git configuration, e.g. after `git config` writes."""
+    global _git_config_cache
+    _git_config_cache = None
+
+
+def probe_git_state() -> Dict[str, str]:
+    """Collect working tree status, git config and current branch in one subprocess."""
+    probes = [
+        "git status --porcelain",
+        # -z keeps multi-line values intact, as in read_git_config
+        "git config --list -z",
+        "git branch --show-current",
+    ]
+    
+    # Run every probe through a single shell, separated by a sentinel. The
+    # config output is NUL-terminated rather than line-based, so the output is
+    # split on the sentinel itself rather than line by line
+    separator = f" & echo {PROBE_SENTINEL} & " if IS_WINDOWS else f"; echo {PROBE_SENTINEL}; "
+    _, stdout, _ = run_shell(separator.join(probes))
+    
+    sections = stdout.split(PROBE_SENTINEL)
+    sections.extend("" for _ in range(len(probes) - len(sections)))
+    status_text, config_text, branch_text = sections[:len(probes)]
+    
+    # One `git config --list` answers both user lookups, and seeds the
+    # cache read_git_config() serves later lookups from
+    global _git_config_cache
+    config = parse_git_config(config_text, null_terminated=True)
+    _git_config_cache = config
+    
+    return {
+        "status": "\n".join(status_text.splitlines()).rstrip(),
+        "user_email": config.get("user.email", ""),
+        "user_name": config.get("user.name", ""),
+        "branch": branch_text.strip()
+    }
+
+
+_remote_info_cache: Optional[Dict] = None
+
+
+def get_remote_info(force: bool = False) -> Dict:
+    """
+    Get information about the remote repository.
+    The answer is cached for the run; pass force=True after changing remotes.
+    """
+    global _remote_info_cache
+    if _remote_info_cache is None or force:
+        repo = open_dulwich_repo()
+        if repo is not None:
+            _remote_info_cache = read_remote_info(repo)
+        else:
+            return_code, stdout, _ = run_command(["git", "remote", "-v"], check=False)
+            _remote_info_cache = parse_remote_info(return_code, stdout)
+    return dict(_remote_info_cache)
+
+
+async def get_remote_info_async() -> Dict:
+    """Asynchronous variant of get_remote_info; always probes and refreshes the cache."""
+    global _remote_info_cache
+    repo = open_dulwich_repo()
+    if repo is not None:
+        # Reading the config from disk is quicker than spawning anything
+        _remote_info_cache = read_remote_info(repo)
+    else:
+        return_code, stdout, _ = await arun_command(["git", "remote", "-v"])
+        _remote_info_cache = parse_remote_info(return_code, stdout)
+    return dict(_remote_info_cache)
+
+
+def reset_repository_caches() -> None:
+    """Forget everything memoized about the current repository."""
+    global _remote_info_cache
+    _remote_info_cache = None
+    get_current_branch.cache_clear()
+    invalidate_git_config()
+
+
+def read_remote_info(repo) -> Dict:
+    """Build the same remote information as parse_remote_info from a dulwich repo's config."""
+    config = repo.get_config()
+    has_remote = any(section[0] == b"remote" for section in config.sections())
+    
+    try:
+        url = config.get((b"remote", b"origin"), b"url").decode("utf-8")
+    except KeyError:
+        url = ""
+    
+    user_name, repo_name = parse_github_url(url)
+    return {
+        "has_remote": has_remote,
+        "remote_url": url if user_name else "",
+        "repo_name": repo_name,
+        "user_name": user_name
+    }
+
+
+def parse_github_url(url: str) -> Tuple[str, str]:
+    """
+    Split a GitHub remote URL into (user_name, repo_name).
+    Handles both HTTPS and SSH formats; returns empty strings for anything else.
+    """
+    if url.startswith(GITHUB_HTTPS_PREFIX):
+        path = url[len(GITHUB_HTTPS_PREFIX):]
+    elif url.startswith(GITHUB_SSH_PREFIX):
+        path = url[len(GITHUB_SSH_PREFIX):]
+    else:
+        # Less common spellings, e.g. embedded credentials or ssh:// URLs
+        match = _REMOTE_RE.match(url)
+        if not match:
+            return "", ""
+        path = "/".join(match.groups())
+    
+    path = path.rstrip("/")
+    if path.endswith(".git"):
+        path = path[:-len(".git")]
+    
+    user, _, repo = path.partition("/")
+    if user and repo:
+        return user, repo
+    return "", ""
+
+
+def parse_remote_info(return_code: int, stdout: str) -> Dict:
+    """Parse the output of `git remote -v` into remote information."""
     has_remote = False
     remote_url = ""
     repo_name = ""
     user_name = ""
     
     # Check if remote exists
-    return_code, stdout, _ = run_command(["git", "remote", "-v"], check=False)
     if return_code == 0 and stdout:
         has_remote = True
         
-        # Parse remote URL
-        # Handle both HTTPS and SSH formats
-        https_match = re.search(r'origin\s+https://github\.com/([^/]+)/([^.]+)(\.git)?', stdout)
-        ssh_match = re.search(r'origin\s+git@github\.com:([^/]+)/([^.]+)(\.git)?', stdout)
-        
-        if https_match:
-            user_name = https_match.group(1)
-            repo_name = https_match.group(2)
-            remote_url = stdout.split()[1]
-        elif ssh_match:
-            user_name = ssh_match.group(1)
-            repo_name = ssh_match.group(2)
-            remote_url = stdout.split()[1]
+        # Parse the origin remote URL
+        for line in stdout.splitlines():
+            parts = line.split()
+            if len(parts) < 2 or parts[0] != "origin":
+                continue
+            
+            user_name, repo_name = parse_github_url(parts[1])
+            if user_name:
+                remote_url = parts[1]
+            break
     
     return {
         "has_remote": has_remote,
@@ -278,6 +989,8 @@ def get_remote_info() -> Dict:
 
 def setup_remote() -> bool:
     """Set up a remote repository."""
+    Confirm, Prompt = _get_prompt()
+    
     print_status(
         "No remote repository found", 
         Status.INFO,
@@ -341,6 +1054,8 @@ def setup_remote() -> bool:
 
 def setup_remote_manual() -> bool:
     """Set up a remote repository manually by asking for the URL."""
+    _, Prompt = _get_prompt()
+    
     # Get remote URL from user
     repo_url = Prompt.ask("Enter the GitHub repository URL")
     
@@ -360,27 +1075,37 @@ def setup_remote_manual() -> bool:
     return True
 
 
-def check_web_files() -> Tuple[bool, List[str]]:
-    """Check for the presence of web files."""
+def fs_name_key(name: str) -> str:
+    """Normalize a file name for lookups, folding case where the filesystem does."""
+    return name.lower() if CASE_INSENSITIVE_FS else name
+
+
+def check_web_files() -> Tuple[bool, List[str], str]:
+    """
+    Check for the presence of web files.
+    Returns whether they are present, the missing files, and the alternative
+    main page found in place of index.html (empty if none was needed).
+    """
     # Basic web files to check for
     web_files = ["index.html"]
     alternatives = ["index.md", "README.md"]
     
+    # Read the directory once instead of stat-ing every candidate
+    # Names are compared the way the filesystem does, so Index.html counts
+    # as index.html wherever opening one would open the other
+    with os.scandir(".") as it:
+        entries = {fs_name_key(entry.name) for entry in it if entry.is_file()}
+    
     # Check for the primary web files
-    missing_files = [file for file in web_files if not os.path.exists(file)]
+    missing_files = [file for file in web_files if fs_name_key(file) not in entries]
     
     # If primary files are missing, check for alternatives
     if missing_files:
         for alt in alternatives:
-            if os.path.exists(alt):
-                print_status(
-                    f"Found {alt} instead of index.html", 
-                    Status.INFO,
-                    "This file will be used as the main page by GitHub Pages."
-                )
-                return True, []
+            if fs_name_key(alt) in entries:
+                return True, [], alt
     
-    return len(missing_files) == 0, missing_files
+    return len(missing_files) == 0, missing_files, ""
 
 
 def create_basic_web_files(missing_files: List[str]) -> bool:
@@ -411,48 +1136,29 @@ def create_basic_web_files(missing_files: List[str]) -> bool:
         return False
 
 
-def check_network_connection() -> bool:
-    """Check if there's an active internet connection."""
-    try:
-        # Try to connect to GitHub
-        socket.create_connection(("github.com", 443), timeout=5)
-        return True
-    except (socket.timeout, socket.error):
-        return False
-
-
 def check_existing_gh_pages(user_name: str, repo_name: str) -> bool:
     """Check if GitHub Pages already exists for this repository."""
     if not user_name or not repo_name:
         return False
         
-    url = f"https://{user_name}.github.io/{repo_name}"
+    host = f"{user_name}.github.io"
+    url = f"https://{host}/{repo_name}"
     
     print_status(f"Checking for existing GitHub Pages at {url}", Status.INFO)
     
-    # First check if we have internet connectivity
-    if not check_network_connection():
+    # A single HEAD request doubles as the connectivity check, so only one
+    # TCP/TLS handshake is made for this step
+    conn = http.client.HTTPSConnection(host, timeout=5)
+    try:
+        conn.request("HEAD", f"/{repo_name}/")
+        status = conn.getresponse().status
+    except OSError:
         print_status(
             "Unable to check for existing GitHub Pages", 
             Status.WARNING,
             "No internet connection detected."
         )
         return False
-    
-    try:
-        # Use urllib instead of curl for better cross-platform compatibility
-        req = urllib.request.Request(url, method="HEAD")
-        response = urllib.request.urlopen(req, timeout=5)
-        return response.status == 200
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return False
-        else:
-            print_status(
-                f"Error checking GitHub Pages status (HTTP {e.code})", 
-                Status.WARNING
-            )
-            return False
     except Exception as e:
         print_status(
             "Unable to check GitHub Pages status", 
@@ -460,15 +1166,28 @@ def check_existing_gh_pages(user_name: str, repo_name: str) -> bool:
             str(e)
         )
         return False
+    finally:
+        conn.close()
+    
+    # Sites with a custom domain answer with a redirect
+    if 200 <= status < 400:
+        return True
+    if status != 404:
+        print_status(
+            f"Error checking GitHub Pages status (HTTP {status})", 
+            Status.WARNING
+        )
+    return False
 
 
-def publish_to_gh_pages(update: bool = False) -> bool:
+def publish_to_gh_pages(update: bool = False, branch: Optional[str] = None) -> bool:
     """Publish the project to GitHub Pages."""
     # First try using gh pages command (newer versions)
     cmd = ["gh", "pages", "deploy"]
     
     # Add current branch if we can determine it
-    branch = get_current_branch()
+    if not branch:
+        branch = get_current_branch()
     if branch:
         cmd.extend(["--branch", branch])
     
@@ -516,24 +1235,137 @@ def publish_to_gh_pages(update: bool = False) -> bool:
         return False
 
 
-def publish_using_git_fallback(source_branch: str) -> bool:
+def _dir_prefix(path: str) -> str:
     """
-    Safe git-based approach to publish to GitHub Pages when gh CLI pages command is unavailable.
-    This approach preserves your working directory by using a separate worktree or temp directory.
+    Return path with exactly one trailing separator.
+    Paths below it can then be built and split with plain string operations,
+    which is much cheaper than os.path.join/relpath in per-file loops.
     """
-    print_status(
-        "Using safe git-based GitHub Pages deployment", 
-        Status.INFO,
-        "This will NOT affect your current project files."
-    )
-    
-    # Store current branch to return to it later
-    original_branch = source_branch
-    current_dir = os.getcwd()
+    return path.rstrip(os.sep) + os.sep
+
+
+def collect_web_files(root: str, extra_files: Tuple[str, ...] = ()) -> List[str]:
+    """
+    Collect the paths, relative to root, of the web files worth publishing.
+    The top level is read once and only the asset directories are walked,
+    so every candidate file is visited exactly once.
+    """
+    root_files = {fs_name_key(name) for name in WEB_ROOT_FILES | set(extra_files)}
+    root_prefix = _dir_prefix(root)
+    paths = []
     
-    # Create a temporary directory outside the current project
-    deploy_dir = os.path.join(tempfile.gettempdir(), f"gh_pages_deploy_{int(time.time())}")
-    os.makedirs(deploy_dir, exist_ok=True)
+    with os.scandir(root) as it:
+        entries = list(it)
+    
+    for entry in entries:
+        # Hidden files were never matched by the old glob patterns either
+        if entry.name.startswith("."):
+            continue
+        
+        if entry.is_file():
+            if (fs_name_key(entry.name) in root_files
+                    or fs_name_key(os.path.splitext(entry.name)[1]) in WEB_ROOT_EXTENSIONS):
+                paths.append(entry.name)
+        elif entry.is_dir() and fs_name_key(entry.name) in WEB_ASSET_DIRS:
+            for dir_path, dir_names, file_names in os.walk(entry.path):
+                dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+                rel_prefix = dir_path[len(root_prefix):] + os.sep
+                paths.extend(
+                    rel_prefix + name for name in file_names if not name.startswith(".")
+                )
+    
+    return paths
+
+
+def collect_all_files(root: str) -> List[str]:
+    """Collect the paths, relative to root, of every file below root."""
+    root_prefix = _dir_prefix(root)
+    paths = []
+    for dir_path, _, file_names in os.walk(root):
+        rel_prefix = dir_path[len(root_prefix):] + os.sep if dir_path != root else ""
+        paths.extend(rel_prefix + name for name in file_names)
+    return paths
+
+
+def fast_copy(src: str, dst: str) -> None:
+    """
+    Copy src to dst along with its metadata, like shutil.copy2.
+    On Linux the data is copied in-kernel with copy_file_range, which
+    filesystems such as btrfs and xfs can turn into a reflink.
+    """
+    if IS_LINUX and hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            # Some filesystems report 0 bytes copied instead of failing;
+            # copy2 then rewrites the truncated dst from scratch
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            # Unsupported across these filesystems; copy2 rewrites dst from scratch
+            pass
+    
+    # Elsewhere copy2 already uses the platform's native file copy
+    shutil.copy2(src, dst)
+
+
+def _copy_pair(pair: Tuple[str, str]) -> None:
+    fast_copy(*pair)
+
+
+def copy_files(src_root: str, dst_root: str, rel_paths: List[str]) -> None:
+    """
+    Copy files given relative to src_root to the same relative paths under dst_root.
+    Directories are created up front; the copies themselves run on a thread pool
+    since each one spends most of its time blocked on disk I/O.
+    """
+    src_prefix = _dir_prefix(src_root)
+    dst_prefix = _dir_prefix(dst_root)
+    pairs = [(src_prefix + rel_path, dst_prefix + rel_path) for rel_path in rel_paths]
+    
+    # One makedirs per distinct directory rather than per file
+    seen_dirs = set()
+    for rel_path in rel_paths:
+        rel_dir = rel_path.rpartition(os.sep)[0]
+        if rel_dir not in seen_dirs:
+            seen_dirs.add(rel_dir)
+            os.makedirs(dst_prefix + rel_dir, exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        # Consume the results so a failed copy raises here
+        list(executor.map(_copy_pair, pairs))
+
+
+def publish_using_git_fallback(source_branch: str) -> bool:
+    """
+    Safe git-based approach to publish to GitHub Pages when gh CLI pages command is unavailable.
+    This approach preserves your working directory by using a separate worktree or temp directory.
+    """
+    import tempfile
+    
+    print_status(
+        "Using safe git-based GitHub Pages deployment", 
+        Status.INFO,
+        "This will NOT affect your current project files."
+    )
+    
+    # Store current branch to return to it later
+    original_branch = source_branch
+    current_dir = os.getcwd()
+    
+    # Read the project's git config now; later commands run in the deploy directory
+    git_config = read_git_config()
+    remote_url = git_config.get("remote.origin.url", "").strip()
+    
+    # Create a temporary directory outside the current project
+    deploy_dir = os.path.join(tempfile.gettempdir(), f"gh_pages_deploy_{int(time.time())}")
+    os.makedirs(deploy_dir, exist_ok=True)
     
     try:
         # Check if we have a gh-pages branch already
@@ -544,8 +1376,7 @@ def publish_using_git_fallback(source_branch: str) -> bool:
         if branch_exists_remotely:
             clone_cmd = ["git", "clone", "--branch", "gh-pages", "--single-branch", "--depth", "1"]
             # Get the remote URL
-            ret_code, remote_url, _ = run_command(["git", "remote", "get-url", "origin"], check=False)
-            if ret_code != 0 or not remote_url:
+            if not remote_url:
                 print_status("Failed to get remote URL", Status.ERROR)
                 return False
                 
@@ -564,51 +1395,48 @@ def publish_using_git_fallback(source_branch: str) -> bool:
         
         # Initialize git if needed (if we didn't clone successfully)
         if not os.path.exists(os.path.join(deploy_dir, ".git")):
-            init_cmd = ["git", "init"]
-            run_command(init_cmd)
+            run_quiet(["git", "init"])
             
             # Setup remote
-            ret_code, remote_url, _ = run_command(["git", "remote", "get-url", "origin"], cwd=current_dir, check=False)
-            if ret_code == 0 and remote_url:
-                run_command(["git", "remote", "add", "origin", remote_url])
+            if remote_url:
+                run_quiet(["git", "remote", "add", "origin", remote_url])
         
         # Clear the directory contents (but keep .git)
-        for item in os.listdir(deploy_dir):
-            if item != ".git":
-                item_path = os.path.join(deploy_dir, item)
-                if os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
+        with os.scandir(deploy_dir) as it:
+            for entry in it:
+                if entry.name == ".git":
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
                 else:
-                    os.remove(item_path)
+                    os.unlink(entry.path)
         
         # Prepare files for GitHub Pages based on project type
         print_status("Preparing files for GitHub Pages", Status.INFO)
         
+        # One listing of the project root answers every existence check below
+        with os.scandir(current_dir) as it:
+            top_level = {fs_name_key(entry.name): entry.is_dir() for entry in it}
+        
         # Check if this is a React/Node.js project
-        package_json_path = os.path.join(current_dir, "package.json")
-        if os.path.exists(package_json_path):
+        if "package.json" in top_level:
             # This is likely a React, Next.js, or similar project
             print_status("Detected JavaScript/TypeScript project", Status.INFO)
             
             # Check if build directory exists (common for React)
-            build_dirs = ["build", "dist", "out", "public", ".next"]
-            build_dir = None
-            
-            for dir_name in build_dirs:
-                if os.path.exists(os.path.join(current_dir, dir_name)):
-                    build_dir = os.path.join(current_dir, dir_name)
-                    break
+            build_dir = next(
+                (
+                    os.path.join(current_dir, name) for name in BUILD_DIRS
+                    if top_level.get(fs_name_key(name))
+                ),
+                None
+            )
             
             if build_dir:
                 print_status(f"Copying from build directory: {os.path.basename(build_dir)}", Status.INFO)
                 # Copy build folder contents to deploy directory
-                for item in os.listdir(build_dir):
-                    src = os.path.join(build_dir, item)
-                    dst = os.path.join(deploy_dir, item)
-                    if os.path.isdir(src):
-                        shutil.copytree(src, dst)
-                    else:
-                        shutil.copy2(src, dst)
+                published = collect_all_files(build_dir)
+                copy_files(build_dir, deploy_dir, published)
             else:
                 # If no build directory, suggest running build command
                 print_status(
@@ -619,70 +1447,36 @@ def publish_using_git_fallback(source_branch: str) -> bool:
                 
                 # Copy needed files based on project structure
                 # Only copy files that are commonly used in web projects
-                web_files = [
-                    "index.html", "404.html", "*.css", "*.js", "assets/**", 
-                    "images/**", "img/**", "css/**", "js/**", "fonts/**", "media/**"
-                ]
-                
-                for pattern in web_files:
-                    for filepath in glob.glob(os.path.join(current_dir, pattern), recursive=True):
-                        if os.path.isfile(filepath):
-                            rel_path = os.path.relpath(filepath, current_dir)
-                            dst_path = os.path.join(deploy_dir, rel_path)
-                            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                            shutil.copy2(filepath, dst_path)
+                published = collect_web_files(current_dir)
+                copy_files(current_dir, deploy_dir, published)
         else:
             # For non-Node projects or simple websites
             # Copy only web-related files
             print_status("Copying web files", Status.INFO)
-            web_files = [
-                "index.html", "index.md", "README.md", "404.html",
-                "*.css", "*.js", "assets/**", "images/**", "img/**", 
-                "css/**", "js/**", "fonts/**", "media/**"
-            ]
-            
-            for pattern in web_files:
-                for filepath in glob.glob(os.path.join(current_dir, pattern), recursive=True):
-                    if os.path.isfile(filepath):
-                        rel_path = os.path.relpath(filepath, current_dir)
-                        dst_path = os.path.join(deploy_dir, rel_path)
-                        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                        shutil.copy2(filepath, dst_path)
+            published = collect_web_files(current_dir, extra_files=("index.md", "README.md"))
+            copy_files(current_dir, deploy_dir, published)
+        
+        # The deploy directory was emptied above, so it holds exactly what was
+        # copied; keys are folded the way the filesystem compares names
+        published = {fs_name_key(path): path for path in published}
         
         # Create an index.html file if it doesn't exist
-        if not os.path.exists(os.path.join(deploy_dir, "index.html")):
+        if fs_name_key("index.html") not in published:
             # Check for README.md to convert
-            if os.path.exists(os.path.join(deploy_dir, "README.md")):
+            readme_name = published.get(fs_name_key("README.md"))
+            if readme_name:
                 print_status(
                     "Creating index.html from README.md", 
                     Status.INFO
                 )
-                with open(os.path.join(deploy_dir, "README.md"), 'r', encoding='utf-8') as readme:
-                    content = readme.read()
-                
-                with open(os.path.join(deploy_dir, "index.html"), 'w', encoding='utf-8') as index:
-                    index.write(f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitHub Pages</title>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
-        h1, h2, h3 {{ color: #0366d6; }}
-        pre {{ background-color: #f6f8fa; padding: 16px; border-radius: 6px; overflow: auto; }}
-        code {{ font-family: SFMono-Regular, Consolas, "Liberation Mono", Menlo, monospace; }}
-    </style>
-</head>
-<body>
-    <div id="content">
-        <!-- README content will be displayed here -->
-        <h1>GitHub Pages</h1>
-        <p>This page was automatically generated from README.md</p>
-        <pre>{content}</pre>
-    </div>
-</body>
-</html>""")
+                readme_path = os.path.join(deploy_dir, readme_name)
+                index_path = os.path.join(deploy_dir, "index.html")
+                with open(readme_path, 'r', encoding='utf-8') as readme, \
+                        open(index_path, 'w', encoding='utf-8') as index:
+                    index.write(README_INDEX_HEADER)
+                    for chunk in iter(lambda: readme.read(README_CHUNK_SIZE), ""):
+                        index.write(html.escape(chunk, quote=False))
+                    index.write(README_INDEX_FOOTER)
             else:
                 # Create a basic index.html
                 print_status(
@@ -709,26 +1503,18 @@ def publish_using_git_fallback(source_branch: str) -> bool:
 </html>""")
         
         # Setup git user info if needed (copy from main repo)
-        ret_code, name, _ = run_command(["git", "config", "user.name"], cwd=current_dir, check=False)
-        if ret_code == 0 and name:
-            run_command(["git", "config", "user.name", name.strip()])
+        name = git_config.get("user.name", "").strip()
+        if name:
+            run_quiet(["git", "config", "user.name", name])
             
-        ret_code, email, _ = run_command(["git", "config", "user.email"], cwd=current_dir, check=False)
-        if ret_code == 0 and email:
-            run_command(["git", "config", "user.email", email.strip()])
+        email = git_config.get("user.email", "").strip()
+        if email:
+            run_quiet(["git", "config", "user.email", email])
         
         # Create .nojekyll file to bypass Jekyll processing
         with open(os.path.join(deploy_dir, ".nojekyll"), 'w') as f:
             pass
         
-        # Add all files
-        run_command(["git", "add", "."])
-        
-        # Commit changes
-        run_command([
-            "git", "commit", "-m", "Update GitHub Pages content"
-        ], check=False)
-        
         # Push to gh-pages branch
         push_cmd = ["git", "push", "origin"]
         if branch_exists_remotely:
@@ -736,7 +1522,13 @@ def publish_using_git_fallback(source_branch: str) -> bool:
         else:
             push_cmd.extend(["HEAD:gh-pages", "--force"])
         
-        return_code, stdout, stderr = run_command(push_cmd)
+        # Add, commit, and push in one go; the commit fails harmlessly when
+        # nothing changed since the last deployment
+        return_code, stdout, stderr = run_git_batch([
+            ["git", "add", "."],
+            ["git", "commit", "-m", "Update GitHub Pages content"],
+            push_cmd
+        ], optional=(1,))
         
         if return_code != 0:
             print_status("Failed to push to gh-pages branch", Status.ERROR, stderr)
@@ -762,23 +1554,58 @@ def publish_using_git_fallback(source_branch: str) -> bool:
             pass
 
 
-def commit_changes() -> bool:
+def changed_paths(status: str) -> Optional[List[str]]:
+    """
+    List the paths with unstaged changes that `git status --porcelain` reported.
+    Returns None when they can't be used as-is: escaped names, a path list too
+    long for one command line, or a working directory below the repository
+    root the paths are relative to.
+    """
+    if not check_git_repo():
+        return None
+    
+    paths = []
+    for line in status.splitlines():
+        # Changes that are already staged need no `git add`
+        if line[1:2] == " ":
+            continue
+        path = line[3:]
+        # Only renames and copies print "old -> new"; other names may contain the arrow
+        if "R" in line[:2] or "C" in line[:2]:
+            path = path.split(" -> ", 1)[-1]
+        if path.startswith('"'):
+            # Names with spaces are only wrapped in quotes; escapes would need decoding
+            if "\\" in path:
+                return None
+            path = path[1:-1]
+        paths.append(path)
+    
+    # Each path also costs a separator and, on Windows, possibly quotes
+    if not paths or sum(len(path) + 3 for path in paths) > GIT_ADD_MAX_CHARS:
+        return None
+    return paths
+
+
+def commit_changes(git_state: Optional[Dict[str, str]] = None) -> bool:
     """Commit any uncommitted changes."""
+    Confirm, Prompt = _get_prompt()
+    
     # Check if there are changes to commit
-    return_code, stdout, _ = run_command(["git", "status", "--porcelain"])
+    if git_state is None:
+        git_state = probe_git_state()
     
-    if stdout:
+    if git_state["status"]:
         print_status("Uncommitted changes detected", Status.INFO)
         
         if Confirm.ask("Would you like to commit these changes?"):
             commit_msg = Prompt.ask("Enter commit message", default="Update web files")
             
-            # Add all changes
-            run_command(["git", "add", "."])
+            # Everything is asked up front so the git commands can run as one batch
+            commands = []
             
             # Set git config if needed
-            email_set = run_command(["git", "config", "user.email"], check=False)[0] == 0
-            name_set = run_command(["git", "config", "user.name"], check=False)[0] == 0
+            email_set = bool(git_state["user_email"])
+            name_set = bool(git_state["user_name"])
             
             if not email_set or not name_set:
                 print_status(
@@ -789,14 +1616,24 @@ def commit_changes() -> bool:
                 
                 if not name_set:
                     name = Prompt.ask("Enter your name for git commits")
-                    run_command(["git", "config", "user.name", name])
+                    commands.append(["git", "config", "user.name", name])
                 
                 if not email_set:
                     email = Prompt.ask("Enter your email for git commits")
-                    run_command(["git", "config", "user.email", email])
+                    commands.append(["git", "config", "user.email", email])
+            
+            # Add all changes and commit them; the status probe already walked
+            # the tree, so git only needs to look at the paths it reported
+            paths = changed_paths(git_state["status"])
+            if paths is None:
+                commands.append(["git", "add", "."])
+            else:
+                commands.append(["git", "--literal-pathspecs", "add", "--"] + paths)
+            commands.append(["git", "commit", "-m", commit_msg])
+            return_code, _, stderr = run_git_batch(commands)
             
-            # Commit changes
-            return_code, _, stderr = run_command(["git", "commit", "-m", commit_msg])
+            if not email_set or not name_set:
+                invalidate_git_config()
             
             if return_code != 0:
                 print_status("Failed to commit changes", Status.ERROR, stderr)
@@ -807,34 +1644,202 @@ def commit_changes() -> bool:
     return True
 
 
-def push_changes() -> bool:
-    """Push changes to remote repository."""
-    # Get current branch
-    branch = get_current_branch()
+def count_unpushed_commits(branch: str) -> Optional[int]:
+    """
+    Count the commits on HEAD that origin's copy of branch, where the push goes, doesn't have.
+    Returns None when origin has no such branch yet, so the caller pushes anyway.
+    """
+    return_code, stdout, _ = run_command(
+        ["git", "rev-list", "--count", f"refs/remotes/origin/{branch}..HEAD"], check=False
+    )
+    try:
+        return int(stdout) if return_code == 0 else None
+    except ValueError:
+        return None
+
+
+def start_push(branch: str) -> Optional[subprocess.Popen]:
+    """
+    Start pushing branch to origin in the background and return the process.
+    Network-bound work such as the Pages API lookup can run while it uploads;
+    finish_push collects the result. Returns None if git could not be started.
+    """
+    try:
+        return subprocess.Popen(
+            _resolve_command(["git", "push", "-u", "origin", branch]),
+            stdin=subprocess.DEVNULL,
+            # git push reports everything, errors included, on stderr
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pygit2():
+    """Return the pygit2 module, or None when pygit2 is not installed."""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+
+def count_objects_to_push(branch: str) -> int:
+    """Count the objects reachable from branch that origin doesn't have yet."""
+    return_code, stdout, _ = run_command(
+        ["git", "rev-list", "--objects", "--count", branch, "--not", "--remotes=origin"],
+        check=False
+    )
+    try:
+        return int(stdout) if return_code == 0 else 0
+    except ValueError:
+        return 0
+
+
+def _make_pygit2_callbacks(pygit2):
+    """
+    Build remote callbacks answering credential requests like git would.
+    Refs the server refused are recorded in the callbacks' rejected attribute.
+    """
+    credential_type = pygit2.enums.CredentialType
+    
+    class Callbacks(pygit2.RemoteCallbacks):
+        def __init__(self):
+            super().__init__()
+            self._asked = False
+            self.rejected: Optional[str] = None
+        
+        def push_update_reference(self, refname, message):
+            # libgit2 reports refs refused by the server (protected branches,
+            # hooks) here instead of failing the push
+            if message is not None:
+                self.rejected = f"{refname}: {message}"
+        
+        def credentials(self, url, username_from_url, allowed_types):
+            # libgit2 asks again after rejected credentials; give up instead of looping
+            if self._asked:
+                raise pygit2.GitError("credentials rejected")
+            self._asked = True
+            if allowed_types & credential_type.SSH_KEY:
+                return pygit2.KeypairFromAgent(username_from_url or "git")
+            if allowed_types & credential_type.USERPASS_PLAINTEXT:
+                return_code, token, _ = run_command(["gh", "auth", "token"], check=False)
+                if return_code == 0 and token:
+                    return pygit2.UserPass("x-access-token", token)
+            raise pygit2.GitError("no usable credentials")
+    
+    return Callbacks()
+
+
+def push_with_pygit2(branch: str) -> bool:
+    """
+    Push branch to origin in-process with pygit2 when --use-pygit2 is given.
+    libgit2 builds the pack on one thread per core (threads=0), which pays off
+    once there are at least PYGIT2_MIN_OBJECTS objects to compress. Returns
+    False when the push was not attempted or failed, so callers push with git.
+    """
+    if not _push_options["use_pygit2"]:
+        return False
+    pygit2 = _load_pygit2()
+    if pygit2 is None or count_objects_to_push(branch) < PYGIT2_MIN_OBJECTS:
+        return False
+    
+    try:
+        # Older pygit2 releases lack APIs used here (e.g. enums.CredentialType)
+        callbacks = _make_pygit2_callbacks(pygit2)
+        repo = pygit2.Repository(".")
+        repo.remotes["origin"].push(
+            [f"refs/heads/{branch}"],
+            callbacks=callbacks,
+            threads=0
+        )
+    except (pygit2.GitError, AttributeError, KeyError, TypeError, ValueError) as e:
+        print_status("pygit2 push failed, pushing with git instead", Status.INFO, str(e))
+        return False
+    
+    if callbacks.rejected:
+        print_status("pygit2 push was rejected, pushing with git instead", Status.INFO, callbacks.rejected)
+        return False
+    
+    # Match 'git push -u'; the push itself already succeeded either way
+    try:
+        repo.branches.local[branch].upstream = repo.branches.remote[f"origin/{branch}"]
+    except (pygit2.GitError, KeyError, ValueError):
+        pass
+    return True
+
+
+def get_remote_branches() -> List[str]:
+    """List the branch names on origin with a single ls-remote."""
+    return_code, stdout, _ = run_command(["git", "ls-remote", "--heads", "origin"], check=False)
+    if return_code != 0:
+        return []
+    
+    branches = []
+    for line in stdout.splitlines():
+        # Lines look like "<sha>\trefs/heads/<name>"
+        ref = line.partition("\t")[2]
+        if ref.startswith("refs/heads/"):
+            branches.append(ref[len("refs/heads/"):])
+    return branches
+
+
+def pick_fallback_branch() -> str:
+    """
+    Pick the branch to push when the current one can't be pushed: the first of
+    DEFAULT_BRANCHES that origin already has, or the first one for an empty remote.
+    """
+    remote_branches = set(get_remote_branches())
+    for candidate in DEFAULT_BRANCHES:
+        if candidate in remote_branches:
+            return candidate
+    return DEFAULT_BRANCHES[0]
+
+
+def classify_push_error(line: str) -> Optional[str]:
+    """Return the kind of push error a line of git's stderr reports, if any."""
+    for kind, pattern in _PUSH_ERRORS:
+        if pattern.search(line):
+            return kind
+    return None
+
+
+def finish_push(proc: Optional[subprocess.Popen], branch: str) -> bool:
+    """Wait for a push started by start_push and handle a failed push."""
+    if proc is None:
+        print_status("Failed to push changes", Status.ERROR, "Command not found: git")
+        return False
     
-    # Try to push to the current branch
-    return_code, _, stderr = run_command(["git", "push", "-u", "origin", branch])
+    # Classify each line as it arrives instead of searching the whole output afterwards
+    stderr_lines = []
+    error_kind = None
+    for line in proc.stderr:
+        stderr_lines.append(line)
+        if error_kind is None:
+            error_kind = classify_push_error(line)
+    return_code = proc.wait()
+    stderr = "".join(stderr_lines).strip()
     
     if return_code != 0:
-        # If the branch doesn't exist on remote, suggest creating it
-        if "remote ref does not exist" in stderr:
+        # Pushing another branch only helps when this one was missing; for
+        # authentication, rejected or other errors it would fail the same way
+        if error_kind == "no_ref" and branch not in DEFAULT_BRANCHES:
             print_status(
                 f"Branch '{branch}' doesn't exist on remote yet", 
                 Status.INFO
             )
-            return run_command(["git", "push", "--set-upstream", "origin", branch])[0] == 0
-        
-        # Try with common branch names if current branch push failed
-        common_branches = ["main", "master"]
-        for common_branch in common_branches:
-            if common_branch != branch:
-                print_status(
-                    f"Trying to push to '{common_branch}' branch instead", 
-                    Status.INFO
-                )
-                ret_code, _, _ = run_command(["git", "push", "-u", "origin", common_branch], check=False)
-                if ret_code == 0:
-                    return True
+            
+            # Push a common branch name instead, picked with one look at the remote
+            common_branch = pick_fallback_branch()
+            print_status(
+                f"Trying to push to '{common_branch}' branch instead", 
+                Status.INFO
+            )
+            if run_quiet(["git", "push", "-u", "origin", common_branch]) == 0:
+                return True
         
         print_status("Failed to push changes", Status.ERROR, stderr)
         return False
@@ -842,55 +1847,354 @@ def push_changes() -> bool:
     return True
 
 
-def check_gh_latest_version() -> None:
-    """Check if GitHub CLI is at the latest version."""
-    return_code, stdout, _ = run_command(["gh", "--version"], check=False)
+def get_cache_dir() -> str:
+    """Get the per-user cache directory for this tool."""
+    if IS_WINDOWS:
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    elif IS_MACOS:
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, CACHE_DIR_NAME)
+
+
+def _gh_binary_mtime() -> Optional[float]:
+    """Modification time of the gh executable, which changes whenever gh is upgraded."""
+    try:
+        return os.stat(GH_PATH).st_mtime
+    except OSError:
+        return None
+
+
+def _load_version_cache() -> Optional[Dict]:
+    """Return the cached version check if it is recent and gh has not changed since."""
+    try:
+        with open(os.path.join(get_cache_dir(), VERSION_CACHE_FILE), "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
     
-    if return_code == 0:
+    if not isinstance(cache, dict):
+        return None
+    if time.time() - cache.get("checked_at", 0) >= VERSION_CACHE_TTL:
+        return None
+    if cache.get("gh_mtime") != _gh_binary_mtime():
+        return None
+    return cache
+
+
+def _save_version_cache(gh_version: str, caps: Dict[str, bool], update_available: bool) -> None:
+    """Persist the result of a version check; failures only cost a recheck next time."""
+    cache = {
+        "checked_at": time.time(),
+        "gh_mtime": _gh_binary_mtime(),
+        "gh_version": gh_version,
+        "caps": caps,
+        "update_available": update_available
+    }
+    try:
+        os.makedirs(get_cache_dir(), exist_ok=True)
+        with open(os.path.join(get_cache_dir(), VERSION_CACHE_FILE), "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def parse_gh_caps(gh_version: str) -> Dict[str, bool]:
+    """
+    Work out which optional gh subcommands are available from 'gh --version' output.
+    An unrecognized version reports everything as available, so callers still
+    find out from the command itself.
+    """
+    version = parse_version(_GH_VERSION_RE, gh_version)
+    if version is None:
+        return {feature: True for feature in GH_FEATURE_MIN_VERSIONS}
+    return {feature: version >= minimum for feature, minimum in GH_FEATURE_MIN_VERSIONS.items()}
+
+
+def parse_version(pattern: "re.Pattern", text: str) -> Optional[Tuple[int, ...]]:
+    """Extract a comparable (major, minor, patch) tuple from text, or None."""
+    match = pattern.search(text)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.groups())
+
+
+def get_latest_gh_version() -> Optional[Tuple[int, ...]]:
+    """
+    Look up the latest GitHub CLI release, over the shared REST client when
+    possible. Returns None when it can't be determined.
+    """
+    tag = ""
+    result = github_api_request("GET", GH_LATEST_RELEASE_PATH)
+    if result is not None:
+        status, data = result
+        if status == 200 and isinstance(data, dict):
+            tag = data.get("tag_name") or ""
+    elif get_gh_caps()["api"]:
+        return_code, stdout, _ = run_command(
+            ["gh", "api", GH_LATEST_RELEASE_PATH.lstrip("/"), "--jq", ".tag_name"],
+            check=False
+        )
+        if return_code == 0:
+            tag = stdout
+    return parse_version(_RELEASE_TAG_RE, tag)
+
+
+@functools.lru_cache(maxsize=1)
+def get_gh_version() -> str:
+    """Get the 'gh --version' output, from the version cache when it is fresh."""
+    cache = _load_version_cache()
+    if cache is not None and cache.get("gh_version"):
+        return cache["gh_version"]
+    return_code, gh_version, _ = run_command(["gh", "--version"], check=False)
+    return gh_version if return_code == 0 else ""
+
+
+@functools.lru_cache(maxsize=1)
+def get_gh_caps() -> Dict[str, bool]:
+    """
+    Get the optional gh subcommands available, detected once per run.
+    Cached alongside the version check, so usually no gh process is started.
+    """
+    cache = _load_version_cache()
+    if cache is not None and isinstance(cache.get("caps"), dict):
+        return cache["caps"]
+    return parse_gh_caps(get_gh_version())
+
+
+def reset_tool_caches() -> None:
+    """Forget where git and gh are and what gh supports, e.g. after PATH changed."""
+    global GH_PATH, GIT_PATH
+    GH_PATH = shutil.which("gh") or "gh"
+    GIT_PATH = shutil.which("git") or "git"
+    _RESOLVED_EXECUTABLES.update(gh=GH_PATH, git=GIT_PATH)
+    which.cache_clear()
+    is_gh_installed.cache_clear()
+    get_gh_version.cache_clear()
+    get_gh_caps.cache_clear()
+
+
+def check_gh_latest_version() -> bool:
+    """
+    Check whether a newer GitHub CLI version is available.
+    The result is cached on disk for a day; set NOTASHARE_SKIP_VERSION_CHECK=1
+    to skip the check entirely.
+    """
+    if os.environ.get(SKIP_VERSION_CHECK_ENV) == "1":
+        return False
+    
+    cache = _load_version_cache()
+    if cache is None:
+        gh_version = get_gh_version()
+        if not gh_version:
+            return False
+        
+        update_available = False
         # Only proceed with update check if we're not on Windows, as updating on Windows
-        # typically requires admin privileges and is better handled through package managers
-        if not is_windows():
-            return_code, stdout, stderr = run_command(["gh", "update", "--check"], check=False)
-            
-            # Handle unknown command error
-            if return_code != 0 and "unknown command" in stderr and "update" in stderr:
-                # Skip update check for older versions that don't support it
-                pass
-            elif return_code == 0 and "new version" in stdout.lower():
-                print_status(
-                    "A new version of GitHub CLI is available", 
-                    Status.INFO,
-                    "Consider updating with 'gh update'"
-                )
+        # typically requires admin privileges and is better handled through package managers.
+        # Versions are compared numerically, so 2.9.0 counts as older than 2.10.0
+        if not IS_WINDOWS:
+            current = parse_version(_GH_VERSION_RE, gh_version)
+            latest = get_latest_gh_version()
+            update_available = current is not None and latest is not None and latest > current
+        
+        _save_version_cache(gh_version, get_gh_caps(), update_available)
+    else:
+        update_available = cache.get("update_available", False)
+    
+    return update_available
 
 
-def configure_gh_pages_source() -> bool:
+class GitHubClient:
+    """
+    Minimal GitHub REST API client.
+    Requests share one keep-alive HTTPS connection, so only the first one pays
+    for the TCP/TLS handshake, and no gh process is started per call.
+    """
+    
+    def __init__(self, token: str):
+        self._token = token
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._lock = threading.Lock()
+    
+    def request(self, method: str, path: str, body: Optional[Dict] = None) -> Tuple[int, object]:
+        """Send a request and return the HTTP status and the decoded JSON body (None if empty)."""
+        headers = {
+            "Authorization": f"token {self._token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": DAEMON_NAME
+        }
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        
+        with self._lock:
+            reused = self._conn is not None
+            while True:
+                if self._conn is None:
+                    self._conn = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=10)
+                try:
+                    self._conn.request(method, path, body=payload, headers=headers)
+                    response = self._conn.getresponse()
+                    data = response.read()
+                    break
+                except (http.client.HTTPException, OSError):
+                    self.close()
+                    # GitHub may have dropped an idle connection; retry once on a fresh one
+                    if not reused:
+                        raise
+                    reused = False
+        
+        try:
+            return response.status, json.loads(data) if data else None
+        except ValueError:
+            return response.status, None
+    
+    def close(self) -> None:
+        """Close the underlying connection; the next request reconnects."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_github_client: Optional[GitHubClient] = None
+# Set once 'gh auth token' has failed, so it isn't retried on every request
+_github_token_missing = False
+_github_client_lock = threading.Lock()
+
+
+def get_github_client() -> Optional[GitHubClient]:
+    """
+    Get the shared REST client, authenticated with gh's token on first use.
+    Returns None when no token is available (e.g. gh is too old for 'gh auth token'),
+    in which case callers fall back to 'gh api'. Either outcome is remembered
+    until reset_github_client().
+    """
+    global _github_client, _github_token_missing
+    with _github_client_lock:
+        if _github_client is None and not _github_token_missing:
+            return_code, token, _ = run_command(["gh", "auth", "token"], check=False)
+            if return_code != 0 or not token:
+                _github_token_missing = True
+            else:
+                _github_client = GitHubClient(token)
+        return _github_client
+
+
+def reset_github_client() -> None:
+    """Forget the shared REST client, e.g. after the gh login changed."""
+    global _github_client, _github_token_missing
+    with _github_client_lock:
+        _github_token_missing = False
+        if _github_client is not None:
+            _github_client.close()
+            _github_client = None
+
+
+def github_api_request(
+    method: str, path: str, body: Optional[Dict] = None
+) -> Optional[Tuple[int, object]]:
+    """
+    Call the GitHub REST API through the shared client.
+    Returns None when the client is unavailable, the request could not be sent,
+    or the token was rejected, so callers can fall back to 'gh api'.
+    """
+    client = get_github_client()
+    if client is None:
+        return None
+    
+    try:
+        status, data = client.request(method, path, body)
+    except (http.client.HTTPException, OSError):
+        return None
+    
+    if status == 401:
+        reset_github_client()
+        return None
+    return status, data
+
+
+def get_pages_state(remote_info: Optional[Dict] = None) -> Dict:
+    """
+    Look up the repository's GitHub Pages configuration with a single API call.
+    The result drives both configuring the Pages source and deciding whether a
+    site already exists.
+    """
+    state = {
+        "api_available": True,
+        # None means the API could not tell us either way
+        "configured": None,
+        "html_url": ""
+    }
+    
+    if remote_info and remote_info["user_name"] and remote_info["repo_name"]:
+        result = github_api_request(
+            "GET", f"/repos/{remote_info['user_name']}/{remote_info['repo_name']}/pages"
+        )
+        if result is not None:
+            status, data = result
+            if status == 200:
+                state["configured"] = True
+                if isinstance(data, dict):
+                    state["html_url"] = data.get("html_url") or ""
+            elif status == 404:
+                state["configured"] = False
+            return state
+    
+    if not get_gh_caps()["api"]:
+        state["api_available"] = False
+        return state
+    
+    return_code, stdout, stderr = run_command(["gh", "api", "repos/:owner/:repo/pages"], check=False)
+    
+    if return_code == 0:
+        state["configured"] = True
+        try:
+            state["html_url"] = json.loads(stdout).get("html_url") or ""
+        except (ValueError, AttributeError):
+            pass
+    elif "HTTP 404" in stderr:
+        state["configured"] = False
+    
+    return state
+
+
+def configure_gh_pages_source(
+    pages_state: Optional[Dict] = None,
+    branch: Optional[str] = None,
+    remote_info: Optional[Dict] = None
+) -> bool:
     """Configure the GitHub Pages source branch if needed."""
     # Check current GitHub Pages configuration
-    return_code, stdout, stderr = run_command(["gh", "api", "repos/:owner/:repo/pages"], check=False)
+    if pages_state is None:
+        pages_state = get_pages_state(remote_info)
     
     # If gh api command not available or fails
-    if return_code != 0:
+    if not pages_state["configured"]:
         # Check if it's because the command is not available
-        if "unknown command" in stderr and "api" in stderr:
-            print_status(
-                "GitHub CLI API command not available in this version", 
-                Status.INFO,
-                "Skipping automated configuration. Please configure GitHub Pages in repository settings."
-            )
-            print_status(
-                "Configuration instructions", 
-                Status.INFO,
-                "1. Go to your repository on GitHub\n"
-                "2. Navigate to Settings > Pages\n"
-                "3. Under 'Source', select branch 'gh-pages'\n"
-                "4. Click Save"
-            )
+        if not pages_state["api_available"]:
+            with batched_status():
+                print_status(
+                    "GitHub CLI API command not available in this version", 
+                    Status.INFO,
+                    "Skipping automated configuration. Please configure GitHub Pages in repository settings."
+                )
+                print_status(
+                    "Configuration instructions", 
+                    Status.INFO,
+                    "1. Go to your repository on GitHub\n"
+                    "2. Navigate to Settings > Pages\n"
+                    "3. Under 'Source', select branch 'gh-pages'\n"
+                    "4. Click Save"
+                )
             return True
         
         # If Pages aren't configured yet, or if there's an error, we'll set them up
         # Get the current branch
-        branch = get_current_branch()
+        if not branch:
+            branch = get_current_branch()
         
         print_status(
             "Configuring GitHub Pages in repository settings", 
@@ -899,15 +2203,28 @@ def configure_gh_pages_source() -> bool:
         )
         
         # Create the gh-pages branch if it doesn't exist
-        create_branch_cmd = [
-            "gh", "api", "--method", "POST", "repos/:owner/:repo/pages",
-            "-f", f"source.branch={branch}",
-            "-f", "source.path=/"
-        ]
+        result = None
+        if remote_info and remote_info["user_name"] and remote_info["repo_name"]:
+            result = github_api_request(
+                "POST",
+                f"/repos/{remote_info['user_name']}/{remote_info['repo_name']}/pages",
+                {"source": {"branch": branch, "path": "/"}}
+            )
         
-        return_code, _, stderr = run_command(create_branch_cmd, check=False)
+        if result is not None:
+            # 409 Conflict means Pages are already enabled
+            configured = result[0] in (201, 409)
+        else:
+            create_branch_cmd = [
+                "gh", "api", "--method", "POST", "repos/:owner/:repo/pages",
+                "-f", f"source.branch={branch}",
+                "-f", "source.path=/"
+            ]
+            
+            return_code, _, stderr = run_command(create_branch_cmd, check=False)
+            configured = return_code == 0 or "pages already exist" in stderr.lower()
         
-        if return_code != 0 and "pages already exist" not in stderr.lower():
+        if not configured:
             print_status(
                 "Failed to configure GitHub Pages", 
                 Status.WARNING,
@@ -918,64 +2235,487 @@ def configure_gh_pages_source() -> bool:
     return True
 
 
-def main() -> int:
-    """Main function to orchestrate the GitHub Pages publishing process."""
-    console.print(Panel.fit(
-        "[bold blue]GitHub Pages Publisher[/bold blue]\n"
-        f"Running on [yellow]{platform.system()}[/yellow] ({platform.platform()})"
-    ))
+async def run_preflight_checks() -> Dict:
+    """Run the pre-flight probes that don't depend on each other concurrently."""
+    # Finding gh and the repository are a PATH lookup and a stat; only the
+    # other probes wait on subprocesses or the network
+    installed = is_gh_installed()
+    is_repo = check_git_repo()
+    
+    loop = asyncio.get_running_loop()
+    
+    async def update_check() -> bool:
+        if not installed:
+            return False
+        # The version check is blocking code, so give it a worker thread
+        return await loop.run_in_executor(None, check_gh_latest_version)
+    
+    authenticated, remote_info, update_available, web_files = await asyncio.gather(
+        is_gh_authenticated_async(),
+        get_remote_info_async(),
+        update_check(),
+        loop.run_in_executor(None, check_web_files)
+    )
+    return {
+        "installed": installed,
+        "authenticated": authenticated,
+        "is_repo": is_repo,
+        "remote_info": remote_info,
+        "update_available": update_available,
+        "web_files": web_files
+    }
+
+
+class _DaemonOutput:
+    """File-like object that forwards console output to a daemon client."""
+    
+    def __init__(self, conn, tty: bool):
+        self._conn = conn
+        self._tty = tty
+    
+    def write(self, text: str) -> int:
+        _send_message(self._conn, {"type": "output", "data": text})
+        return len(text)
+    
+    def flush(self) -> None:
+        pass
+    
+    def isatty(self) -> bool:
+        return self._tty
+
+
+class _DaemonInput:
+    """File-like object that reads prompt answers from a daemon client."""
+    
+    def __init__(self, conn):
+        self._conn = conn
+    
+    def readline(self) -> str:
+        _send_message(self._conn, {"type": "input"})
+        return _recv_message(self._conn).get("data", "")
+
+
+def _send_message(conn, message: Dict) -> None:
+    """Send a JSON message over a daemon connection."""
+    conn.send_bytes(json.dumps(message).encode("utf-8"))
+
+
+def _recv_message(conn) -> Dict:
+    """Receive a JSON message from a daemon connection."""
+    return json.loads(conn.recv_bytes().decode("utf-8"))
+
+
+def get_daemon_address() -> Tuple[str, str]:
+    """Get the per-user daemon address and its multiprocessing family."""
+    if IS_WINDOWS:
+        import getpass
+        return rf"\\.\pipe\{DAEMON_NAME}-{getpass.getuser()}", "AF_PIPE"
+    
+    import tempfile
+    return os.path.join(tempfile.gettempdir(), f"{DAEMON_NAME}-{os.getuid()}.sock"), "AF_UNIX"
+
+
+def handle_daemon_request(conn) -> None:
+    """Run one publish request received by the daemon."""
+    global _console
+    
+    request = _recv_message(conn)
+    # Cached repository state belongs to whichever directory the last request
+    # ran in, and the gh login or installed tools may have changed since then
+    reset_repository_caches()
+    reset_github_client()
+    reset_tool_caches()
+    if request.get("cmd") == "ping":
+        _send_message(conn, {"type": "exit", "code": 0})
+        return
+    if request.get("cmd") != "publish":
+        _send_message(conn, {"type": "exit", "code": 2})
+        return
+    
+    _import_rich()
+    from rich.console import Console
+    
+    # Route console output and prompts through the connection for the
+    # duration of the request
+    previous_console, previous_cwd = _console, os.getcwd()
+    previous_stdin, previous_stdout = sys.stdin, sys.stdout
+    output = _DaemonOutput(conn, request.get("tty", False))
+    _console = Console(
+        file=output,
+        force_terminal=request.get("tty", False),
+        width=request.get("width")
+    )
+    # Plain (--no-rich) output and prompts go through sys.stdout/sys.stdin
+    sys.stdin, sys.stdout = _DaemonInput(conn), output
+    
+    # Run with the client's environment (PATH, GH_TOKEN, GIT_*, ...). The shell
+    # session and tool lookups are restarted so they see it too
+    previous_environ = dict(os.environ)
+    client_environ = request.get("env")
+    if client_environ is not None:
+        os.environ.clear()
+        os.environ.update(client_environ)
+        reset_shell_session()
+        reset_tool_caches()
+    
+    try:
+        os.chdir(request["cwd"])
+        code = run_publish(request.get("argv", []))
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        code = 1
+        print_status("Daemon request failed", Status.ERROR, str(e))
+    finally:
+        os.chdir(previous_cwd)
+        _console = previous_console
+        sys.stdin, sys.stdout = previous_stdin, previous_stdout
+        if client_environ is not None:
+            os.environ.clear()
+            os.environ.update(previous_environ)
+            reset_shell_session()
+    
+    _send_message(conn, {"type": "exit", "code": code})
+
+
+def serve_daemon() -> int:
+    """Keep the publisher loaded and serve publish requests over a local socket."""
+    from multiprocessing.connection import Listener
+    
+    address, family = get_daemon_address()
+    if run_via_daemon(None, probe_only=True) is not None:
+        print_status("A publisher daemon is already running", Status.ERROR, address)
+        return 1
+    
+    # Remove a socket left behind by a daemon that did not shut down cleanly
+    if family == "AF_UNIX" and os.path.exists(address):
+        os.unlink(address)
     
-    # Step 1: Check if gh CLI is installed
-    if not is_gh_installed():
-        instructions = get_gh_installation_instructions()
+    # Only the current user may connect to the socket
+    old_umask = os.umask(0o077) if family == "AF_UNIX" else None
+    try:
+        listener = Listener(address, family)
+    finally:
+        if old_umask is not None:
+            os.umask(old_umask)
+    
+    # Load rich up front so requests don't pay for it
+    _get_console()
+    import rich.prompt  # noqa: F401
+    print_status(f"Daemon listening on {address}", Status.INFO, "Press Ctrl+C to stop.")
+    
+    with listener:
+        while True:
+            conn = listener.accept()
+            with conn:
+                try:
+                    handle_daemon_request(conn)
+                except (EOFError, OSError):
+                    # Client disconnected mid-request
+                    continue
+
+
+def run_via_daemon(argv: Optional[List[str]], probe_only: bool = False) -> Optional[int]:
+    """
+    Forward a publish run to a running daemon.
+    Returns the exit code, or None if no daemon is reachable.
+    """
+    from multiprocessing.connection import Client
+    
+    address, family = get_daemon_address()
+    if family == "AF_UNIX" and not os.path.exists(address):
+        return None
+    
+    try:
+        conn = Client(address, family)
+    except OSError:
+        return None
+    
+    with conn:
+        if probe_only:
+            try:
+                _send_message(conn, {"cmd": "ping"})
+                return _recv_message(conn)["code"]
+            except (EOFError, OSError):
+                return None
+        
+        _send_message(conn, {
+            "cmd": "publish",
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "argv": argv,
+            "tty": sys.stdout.isatty(),
+            "width": shutil.get_terminal_size().columns
+        })
+        
+        while True:
+            try:
+                message = _recv_message(conn)
+            except (EOFError, OSError):
+                print("Lost connection to the publisher daemon", file=sys.stderr)
+                return 1
+            
+            if message["type"] == "output":
+                sys.stdout.write(message["data"])
+                sys.stdout.flush()
+            elif message["type"] == "input":
+                _send_message(conn, {"type": "line", "data": sys.stdin.readline()})
+            elif message["type"] == "exit":
+                return message["code"]
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Publish a project to GitHub Pages.")
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="stay resident and serve publish requests from later invocations"
+    )
+    parser.add_argument(
+        "--no-daemon", action="store_true",
+        help="run in this process even if a daemon is running"
+    )
+    parser.add_argument(
+        "-y", "--yes", action="store_true",
+        help="answer yes to every confirmation"
+    )
+    parser.add_argument(
+        "--non-interactive", action="store_true",
+        help="never read from stdin; questions take their default answer"
+    )
+    parser.add_argument(
+        "--no-rich", action="store_true",
+        help="print plain text and don't load the rich library"
+    )
+    parser.add_argument(
+        "--use-pygit2", action="store_true",
+        help="push large changes with pygit2's multi-threaded pack builder, if installed"
+    )
+    parser.add_argument(
+        "--repos", metavar="FILE",
+        help="publish every repository directory listed in FILE, one per line (requires --yes)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=DEFAULT_JOBS, metavar="N",
+        help=f"repositories to publish at once with --repos (default: {DEFAULT_JOBS})"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point: serve as a daemon, forward to one, or publish directly."""
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parse_args(argv)
+    
+    if args.daemon:
+        configure_ui(args)
+        return serve_daemon()
+    
+    if args.repos:
+        configure_ui(args)
+        return publish_repos(args, argv)
+    
+    if not args.no_daemon:
+        code = run_via_daemon(argv)
+        if code is not None:
+            return code
+    
+    return run_publish(argv)
+
+
+def read_repo_list(path: str) -> List[str]:
+    """Read the repository directories listed in a --repos file, skipping blanks and # comments."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f]
+    return [os.path.abspath(line) for line in lines if line and not line.startswith("#")]
+
+
+def _publish_one(job: Tuple[str, List[str]]) -> Tuple[str, int, str]:
+    """Publish one repository of a --repos run in a pool worker, capturing its output."""
+    import io
+    
+    repo_dir, argv = job
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            os.chdir(repo_dir)
+            code = run_publish(argv)
+        except Exception as e:
+            print_status("Publishing failed", Status.ERROR, str(e))
+            code = 1
+    return repo_dir, code, output.getvalue()
+
+
+def publish_repos(args, argv: List[str]) -> int:
+    """
+    Publish every repository listed in the --repos file, at most --jobs at a time.
+    Each repository gets a fresh worker process, so no state memoized for one
+    leaks into the next, and its output is printed in one piece once it is done.
+    """
+    import multiprocessing
+    
+    # Workers can't share the terminal's stdin, so every question must be
+    # answered up front; declining them all would publish nothing
+    if not args.yes:
         print_status(
-            "GitHub CLI is not installed", 
+            "--repos requires --yes", 
             Status.ERROR,
-            f"Installation instructions:\n{instructions}"
+            "Batch runs can't ask questions, so every confirmation has to be answered up front."
         )
         return 1
     
-    print_status("GitHub CLI is installed", Status.SUCCESS)
-    check_gh_latest_version()
+    try:
+        repo_dirs = read_repo_list(args.repos)
+    except OSError as e:
+        print_status(f"Cannot read repository list {args.repos}", Status.ERROR, str(e))
+        return 1
+    if not repo_dirs:
+        print_status(f"No repositories listed in {args.repos}", Status.WARNING)
+        return 0
     
-    # Step 2: Check if gh CLI is authenticated
-    if not is_gh_authenticated():
-        print_status("GitHub CLI is not authenticated", Status.WARNING)
-        if not authenticate_gh():
-            print_status("Authentication failed", Status.ERROR)
-            return 1
+    # --yes answers the confirmations; free-form questions take their defaults
+    if not args.non_interactive:
+        argv = argv + ["--non-interactive"]
     
-    print_status("GitHub CLI is authenticated", Status.SUCCESS)
+    jobs = max(1, min(args.jobs, len(repo_dirs)))
+    failed = []
+    with multiprocessing.Pool(jobs, maxtasksperchild=1) as pool:
+        for repo_dir, code, output in pool.imap(_publish_one, [(d, argv) for d in repo_dirs]):
+            sys.stdout.write(output)
+            if code == 0:
+                print_status(f"Published {repo_dir}", Status.SUCCESS)
+            else:
+                failed.append(repo_dir)
+                print_status(f"Failed to publish {repo_dir}", Status.ERROR)
     
-    # Step 3: Check if current directory is a git repository
-    if not check_git_repo():
-        print_status("Not a git repository", Status.WARNING)
-        if Confirm.ask("Initialize git repository?"):
-            if not initialize_git_repo():
-                print_status("Failed to initialize git repository", Status.ERROR)
-                return 1
-            print_status("Git repository initialized", Status.SUCCESS)
-        else:
-            print_status("Cannot proceed without a git repository", Status.ERROR)
-            return 1
+    if failed:
+        print_status(
+            f"{len(failed)} of {len(repo_dirs)} repositories failed", 
+            Status.ERROR,
+            "\n".join(failed)
+        )
+        return 1
+    return 0
+
+
+def run_publish(argv: Optional[List[str]] = None) -> int:
+    """Run the publishing process with the UI mode selected on the command line."""
+    args = parse_args(argv)
+    previous_ui = configure_ui(args)
+    previous_push = dict(_push_options)
+    _push_options["use_pygit2"] = args.use_pygit2
+    try:
+        return publish()
+    except InputRequiredError as e:
+        print_status(
+            "Input required in non-interactive mode", 
+            Status.ERROR,
+            f"'{e}' has no default answer. Run without --non-interactive."
+        )
+        return 1
+    finally:
+        _ui.update(previous_ui)
+        _push_options.update(previous_push)
+
+
+def publish() -> int:
+    """Orchestrate the GitHub Pages publishing process."""
+    Confirm, Prompt = _get_prompt()
     
-    # Step 4: Check remote repository
-    remote_info = get_remote_info()
+    if _ui["rich"]:
+        console = _get_console()
+        from rich.panel import Panel
+        console.print(Panel.fit(
+            "[bold blue]GitHub Pages Publisher[/bold blue]\n"
+            f"Running on [yellow]{PLATFORM_NAME}[/yellow] ({platform.platform()})"
+        ))
+    else:
+        print(f"GitHub Pages Publisher\nRunning on {PLATFORM_NAME} ({platform.platform()})")
+    
+    # The pre-flight probes are independent subprocess calls, so run them
+    # concurrently and wait only for the slowest one
+    preflight = asyncio.run(run_preflight_checks())
     
-    if not remote_info["has_remote"]:
-        if not setup_remote():
-            print_status("Cannot proceed without a remote repository", Status.ERROR)
+    # Steps 1-4 mostly report what the pre-flight probes found, so their
+    # messages are rendered together rather than one write each
+    with batched_status():
+        # Step 1: Check if gh CLI is installed
+        if not preflight["installed"]:
+            instructions = get_gh_installation_instructions()
+            print_status(
+                "GitHub CLI is not installed", 
+                Status.ERROR,
+                f"Installation instructions:\n{instructions}"
+            )
             return 1
-        # Refresh remote info
-        remote_info = get_remote_info()
+        
+        print_status("GitHub CLI is installed", Status.SUCCESS)
+        if preflight["update_available"]:
+            print_status(
+                "A new version of GitHub CLI is available", 
+                Status.INFO,
+                "Consider updating with 'gh update'"
+            )
+        
+        # Step 2: Check if gh CLI is authenticated
+        if not preflight["authenticated"]:
+            print_status("GitHub CLI is not authenticated", Status.WARNING)
+            if not _ui["interactive"]:
+                print_status("Run 'gh auth login' first when using --non-interactive", Status.ERROR)
+                return 1
+            if not authenticate_gh():
+                print_status("Authentication failed", Status.ERROR)
+                return 1
+        
+        print_status("GitHub CLI is authenticated", Status.SUCCESS)
+        
+        # Step 3: Check if current directory is a git repository
+        is_repo = preflight["is_repo"]
+        if not is_repo:
+            print_status("Not a git repository", Status.WARNING)
+            if Confirm.ask("Initialize git repository?"):
+                if not initialize_git_repo():
+                    print_status("Failed to initialize git repository", Status.ERROR)
+                    return 1
+                print_status("Git repository initialized", Status.SUCCESS)
+            else:
+                print_status("Cannot proceed without a git repository", Status.ERROR)
+                return 1
+        
+        # Step 4: Check remote repository
+        # A freshly initialized repository may sit inside another one, whose
+        # remotes the pre-flight probe would have reported
+        remote_info = preflight["remote_info"] if is_repo else get_remote_info(force=True)
+        
+        if not remote_info["has_remote"]:
+            if not setup_remote():
+                print_status("Cannot proceed without a remote repository", Status.ERROR)
+                return 1
+            # Refresh remote info
+            remote_info = get_remote_info(force=True)
+        
+        print_status(
+            f"Connected to remote: {remote_info['remote_url']}", 
+            Status.SUCCESS
+        )
     
-    print_status(
-        f"Connected to remote: {remote_info['remote_url']}", 
-        Status.SUCCESS
-    )
+    # The Pages lookup only needs the remote, so it runs in the background
+    # while the local steps below ask their questions
+    background = ThreadPoolExecutor(max_workers=1)
+    pages_future = background.submit(get_pages_state, remote_info)
+    background.shutdown(wait=False)
     
     # Step 5: Check for web files
-    files_exist, missing_files = check_web_files()
+    files_exist, missing_files, alternative = preflight["web_files"]
+    if alternative:
+        print_status(
+            f"Found {alternative} instead of index.html", 
+            Status.INFO,
+            "This file will be used as the main page by GitHub Pages."
+        )
     
     if not files_exist:
         print_status(
@@ -997,25 +2737,47 @@ def main() -> int:
             return 1
     
     # Step 6: Commit any changes
-    if not commit_changes():
+    git_state = probe_git_state()
+    current_branch = git_state["branch"] or get_current_branch()
+    if not commit_changes(git_state):
         print_status("Cannot proceed with uncommitted changes", Status.ERROR)
         return 1
     
     # Step 7: Push changes
-    if Confirm.ask("Push changes to remote?"):
-        if not push_changes():
+    # The push uploads in the background while the Pages lookup finishes
+    # Re-runs with nothing new to upload skip the push and its network round-trip
+    push_proc = None
+    pushed = False
+    if count_unpushed_commits(current_branch) == 0:
+        print_status("Already up to date with remote", Status.SUCCESS)
+        pushing = False
+    else:
+        pushing = Confirm.ask("Push changes to remote?")
+    if pushing:
+        pushed = push_with_pygit2(current_branch)
+        if not pushed:
+            push_proc = start_push(current_branch)
+    
+    pages_state = pages_future.result()
+    
+    if pushing:
+        if not pushed and not finish_push(push_proc, current_branch):
             print_status("Failed to push changes", Status.ERROR)
             return 1
         print_status("Changes pushed to remote", Status.SUCCESS)
     
     # Step 8: Configure GitHub Pages source
-    configure_gh_pages_source()
+    # Configuring may point Pages at the branch, so it waits for the push
+    configure_gh_pages_source(pages_state, current_branch, remote_info)
     
     # Step 9: Check if GitHub Pages already exists
-    pages_exist = check_existing_gh_pages(
-        remote_info["user_name"], 
-        remote_info["repo_name"]
-    )
+    # The Pages API already answered this unless it was unavailable
+    pages_exist = pages_state["configured"]
+    if pages_exist is None:
+        pages_exist = check_existing_gh_pages(
+            remote_info["user_name"], 
+            remote_info["repo_name"]
+        )
     
     # Step 10: Publish to GitHub Pages
     if pages_exist:
@@ -1030,15 +2792,18 @@ def main() -> int:
             print_status("Publishing cancelled", Status.INFO)
             return 0
         
-        publish_to_gh_pages(update=(choice == "replace"))
+        publish_to_gh_pages(update=(choice == "replace"), branch=current_branch)
     else:
         print_status("No existing GitHub Pages found", Status.INFO)
         if Confirm.ask("Publish to GitHub Pages?"):
-            publish_to_gh_pages()
+            publish_to_gh_pages(branch=current_branch)
     
     # Step 11: Show success message with the URL
-    if remote_info["user_name"] and remote_info["repo_name"]:
-        url = f"https://{remote_info['user_name']}.github.io/{remote_info['repo_name']}"
+    if pages_state["html_url"] or (remote_info["user_name"] and remote_info["repo_name"]):
+        url = (
+            pages_state["html_url"]
+            or f"https://{remote_info['user_name']}.github.io/{remote_info['repo_name']}"
+        )
         print_status(
             "Process completed successfully!", 
             Status.SUCCESS,
@@ -1056,6 +2821,5 @@ if __name__ == "__main__":
         print_status("\nProcess cancelled by user", Status.INFO)
         sys.exit(130)
     except Exception as e:
-        import traceback
         print_status(f"An unexpected error occurred", Status.ERROR, f"{str(e)}\n{traceback.format_exc()}")
         sys.exit(1)
\ No newline at end of file
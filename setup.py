@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Optional native build of the GitHub Pages Publisher.
+
+Compiles gh_push.py into a C extension with Cython. The plain script keeps
+working without this step; the compiled module only trims interpreter
+overhead.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+    python -c "import gh_push, sys; sys.exit(gh_push.main())"
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="gh_push",
+    ext_modules=cythonize(
+        "gh_push.py",
+        language_level=3,
+    ),
+)